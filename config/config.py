@@ -2,6 +2,7 @@
 Configuration module for API test automation
 Contains environment-specific settings and constants
 """
+import os
 
 class Config:
     """Base configuration class"""
@@ -15,6 +16,9 @@ class Config:
     REQUEST_TIMEOUT = 10  # seconds
     CONTENT_TYPE = "application/json"
     
+    # Use httpx with HTTP/2 instead of requests (optional, needs `pip install httpx[http2]`)
+    USE_HTTPX = os.environ.get("USE_HTTPX", "").lower() in ("1", "true", "yes")
+    
     # Response Validation
     EXPECTED_STATUS_CODES = [200, 201]
     
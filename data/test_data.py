@@ -1,7 +1,20 @@
 """
 Test data module - Contains reusable booking payload and test data
 """
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
+
+# Today's date, computed once per test session
+_TODAY = date.today()
+
+# Static fields of the default booking; copied into each payload, never returned directly
+_BASE_PAYLOAD = {
+    "firstname": "John",
+    "lastname": "Doe",
+    "totalprice": 1500,
+    "depositpaid": True,
+    "additionalneeds": "Breakfast included"
+}
 
 
 def get_valid_booking_payload():
@@ -9,22 +22,18 @@ def get_valid_booking_payload():
     Returns a valid booking payload for POST request
     
     Returns:
-        dict: Booking request payload
+        dict: Booking request payload (a fresh copy, safe to mutate)
     """
     # Calculate check-in and check-out dates
-    checkin_date = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-    checkout_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    checkin_date = (_TODAY + timedelta(days=1)).isoformat()
+    checkout_date = (_TODAY + timedelta(days=7)).isoformat()
     
     payload = {
-        "firstname": "John",
-        "lastname": "Doe",
-        "totalprice": 1500,
-        "depositpaid": True,
+        **_BASE_PAYLOAD,
         "bookingdates": {
             "checkin": checkin_date,
             "checkout": checkout_date
-        },
-        "additionalneeds": "Breakfast included"
+        }
     }
     
     return payload
@@ -47,23 +56,42 @@ def get_booking_payload_with_params(firstname="Jane", lastname="Smith",
     Returns:
         dict: Customized booking payload
     """
-    checkin_date = (datetime.now() + timedelta(days=days_from_now)).strftime("%Y-%m-%d")
-    checkout_date = (datetime.now() + timedelta(days=days_from_now + nights)).strftime("%Y-%m-%d")
+    fields, dates = _build_booking_payload(firstname, lastname, totalprice, depositpaid,
+                                           days_from_now, nights)
     
-    payload = {
-        "firstname": firstname,
-        "lastname": lastname,
-        "totalprice": totalprice,
-        "depositpaid": depositpaid,
-        "bookingdates": {
-            "checkin": checkin_date,
-            "checkout": checkout_date
-        }
-    }
+    # Rebuild fresh dicts so callers can safely mutate the returned payload
+    payload = dict(fields)
+    payload["bookingdates"] = dict(dates)
     
     return payload
 
 
+@lru_cache(maxsize=64, typed=True)
+def _build_booking_payload(firstname, lastname, totalprice, depositpaid,
+                           days_from_now, nights):
+    """
+    Builds a frozen booking payload for get_booking_payload_with_params
+    
+    Returns:
+        tuple: (top-level field pairs, bookingdates pairs)
+    """
+    checkin_date = (_TODAY + timedelta(days=days_from_now)).isoformat()
+    checkout_date = (_TODAY + timedelta(days=days_from_now + nights)).isoformat()
+    
+    fields = (
+        ("firstname", firstname),
+        ("lastname", lastname),
+        ("totalprice", totalprice),
+        ("depositpaid", depositpaid),
+    )
+    dates = (
+        ("checkin", checkin_date),
+        ("checkout", checkout_date),
+    )
+    
+    return fields, dates
+
+
 # Test data sets for parameterized testing
 TEST_DATA_SETS = [
     {
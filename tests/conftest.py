@@ -0,0 +1,66 @@
+"""
+Shared pytest fixtures for the booking API test suite
+"""
+import functools
+import json
+import pathlib
+import fastjsonschema
+import pytest
+from config.config import Config
+from utils.api_client import APIClient, AssertionHelper, configure_logging, _json
+from data.test_data import get_valid_booking_payload
+
+_SCHEMA_PATH = pathlib.Path(__file__).resolve().parent.parent / "schemas" / "booking_schema.json"
+
+
+def pytest_configure(config):
+    """Set up logging once the test runner starts"""
+    configure_logging()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_schema(path: pathlib.Path) -> dict:
+    """Load and parse a JSON schema file once per process"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """Single APIClient shared by the whole run so its connection pool stays warm"""
+    client = APIClient(Config.BASE_URL)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def assertion_helper():
+    """Shared AssertionHelper instance"""
+    return AssertionHelper()
+
+
+@pytest.fixture(scope="session")
+def created_booking(api_client):
+    """
+    Create one booking for the whole run, shared by read-only tests
+    
+    Returns:
+        dict: {"id": booking id, "payload": request payload, "post_json": POST response body}
+    """
+    payload = get_valid_booking_payload()
+    resp = api_client.post(Config.BOOKING_ENDPOINT, payload)
+    assert resp.status_code == 200, f"Expected 200 creating shared booking, got {resp.status_code}"
+    post_json = _json(resp)
+    return {"id": post_json["bookingid"], "payload": payload, "post_json": post_json}
+
+
+@pytest.fixture(scope="session")
+def booking_schema():
+    """Parsed booking JSON schema, loaded once for the whole run"""
+    return _cached_schema(_SCHEMA_PATH)
+
+
+@pytest.fixture(scope="session")
+def booking_validator(booking_schema):
+    """Validator function generated once from the booking schema by fastjsonschema"""
+    return fastjsonschema.compile(booking_schema)
@@ -0,0 +1,77 @@
+"""
+APIClient retry tests - Run against a local stub server (no network call)
+"""
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from config.config import Config
+from utils.api_client import APIClient
+
+pytestmark = pytest.mark.skipif(Config.USE_HTTPX, reason="Retry policy applies to the requests transport only")
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answers /unavailable with 503 and stalls on /slow, counting hits per method and path"""
+
+    hits = Counter()
+
+    def _handle(self):
+        self.hits[(self.command, self.path)] += 1
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        if self.path == "/slow":
+            time.sleep(2)
+            return
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = _handle
+    do_POST = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_client():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = APIClient(f"http://127.0.0.1:{server.server_port}")
+    yield client
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+
+class TestAPIClientRetries:
+    """Deterministic tests for the session retry policy."""
+
+    def setup_method(self):
+        _StubHandler.hits.clear()
+
+    def test_get_retries_on_503_and_returns_last_response(self, stub_client):
+        """GET is idempotent: a 503 is retried, then the final response is returned instead of raised."""
+        resp = stub_client.get("/unavailable")
+        assert resp.status_code == 503
+        assert _StubHandler.hits[("GET", "/unavailable")] == 4
+
+    def test_post_is_not_retried_on_503(self, stub_client):
+        """POST is never retried, so a flaky response cannot create a duplicate booking."""
+        resp = stub_client.post("/unavailable", {"firstname": "John"})
+        assert resp.status_code == 503
+        assert _StubHandler.hits[("POST", "/unavailable")] == 1
+
+    def test_read_timeout_is_not_retried(self, stub_client):
+        """A read timeout fails after a single attempt, keeping the per-call timeout a hard limit."""
+        start = time.monotonic()
+        with pytest.raises(requests.exceptions.RequestException):
+            stub_client.get("/slow", timeout=0.5)
+        assert time.monotonic() - start < 2
+        assert _StubHandler.hits[("GET", "/slow")] == 1
@@ -5,7 +5,6 @@ import pytest
 import logging
 from config.config import Config
 from data.test_data import get_valid_booking_payload, get_booking_payload_with_params, TEST_DATA_SETS
-from utils.api_client import APIClient, AssertionHelper
 
 # Configure logging for tests
 logger = logging.getLogger(__name__)
@@ -14,16 +13,7 @@ logger = logging.getLogger(__name__)
 class TestBookingAPI:
     """Test suite for booking API"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup test fixtures"""
-        self.api_client = APIClient(Config.BASE_URL)
-        self.assertion_helper = AssertionHelper()
-        logger.info("\n" + "="*80)
-        logger.info("TEST SETUP COMPLETED")
-        logger.info("="*80)
-    
-    def test_create_booking_with_valid_payload(self):
+    def test_create_booking_with_valid_payload(self, api_client, assertion_helper):
         """
         Test Case 1: Create a booking with valid payload
         
@@ -41,17 +31,17 @@ class TestBookingAPI:
         logger.info(f"Payload prepared: firstname={payload['firstname']}, lastname={payload['lastname']}")
         
         # Step 2: Send POST request
-        response = self.api_client.post(Config.BOOKING_ENDPOINT, payload)
+        response = api_client.post(Config.BOOKING_ENDPOINT, payload)
         
         # Step 3: Validate status code
-        self.assertion_helper.assert_status_code(response)
+        assertion_helper.assert_status_code(response)
         
         # Step 4 & 5: Validate response structure
-        self.assertion_helper.assert_booking_response_structure(response)
+        assertion_helper.assert_booking_response_structure(response)
         
         logger.info("✓ Test passed: Booking created successfully")
     
-    def test_response_contains_booking_id(self):
+    def test_response_contains_booking_id(self, api_client):
         """
         Test Case 2: Verify response contains bookingid
         
@@ -64,7 +54,7 @@ class TestBookingAPI:
         
         # Step 1: Create booking
         payload = get_valid_booking_payload()
-        response = self.api_client.post(Config.BOOKING_ENDPOINT, payload)
+        response = api_client.post(Config.BOOKING_ENDPOINT, payload)
         
         # Step 2 & 3: Verify bookingid
         response_json = response.json()
@@ -74,7 +64,7 @@ class TestBookingAPI:
         
         logger.info(f"✓ Booking ID received: {response_json['bookingid']}")
     
-    def test_booking_details_match_request(self):
+    def test_booking_details_match_request(self, api_client, assertion_helper):
         """
         Test Case 3: Verify booking details in response match the request
         
@@ -96,16 +86,16 @@ class TestBookingAPI:
             lastname=expected_lastname,
             totalprice=expected_price
         )
-        response = self.api_client.post(Config.BOOKING_ENDPOINT, payload)
+        response = api_client.post(Config.BOOKING_ENDPOINT, payload)
         
         # Step 2-4: Verify details match
-        self.assertion_helper.assert_field_value(response, "booking.firstname", expected_firstname)
-        self.assertion_helper.assert_field_value(response, "booking.lastname", expected_lastname)
-        self.assertion_helper.assert_field_value(response, "booking.totalprice", expected_price)
+        assertion_helper.assert_field_value(response, "booking.firstname", expected_firstname)
+        assertion_helper.assert_field_value(response, "booking.lastname", expected_lastname)
+        assertion_helper.assert_field_value(response, "booking.totalprice", expected_price)
         
         logger.info("✓ Test passed: All booking details match request")
     
-    def test_booking_dates_validation(self):
+    def test_booking_dates_validation(self, api_client):
         """
         Test Case 4: Verify booking dates are properly set
         
@@ -121,7 +111,7 @@ class TestBookingAPI:
         expected_checkin = payload["bookingdates"]["checkin"]
         expected_checkout = payload["bookingdates"]["checkout"]
         
-        response = self.api_client.post(Config.BOOKING_ENDPOINT, payload)
+        response = api_client.post(Config.BOOKING_ENDPOINT, payload)
         
         # Step 2 & 3: Verify dates
         response_json = response.json()
@@ -135,32 +125,32 @@ class TestBookingAPI:
         logger.info(f"✓ Check-in date: {booking_dates['checkin']}")
         logger.info(f"✓ Check-out date: {booking_dates['checkout']}")
     
-    def test_deposit_paid_field(self):
+    @pytest.mark.parametrize("deposit", [True, False])
+    def test_deposit_paid_field(self, deposit, api_client, assertion_helper):
         """
         Test Case 5: Verify depositpaid field is correctly reflected
         
         Steps:
-        1. Create booking with depositpaid=True
-        2. Verify response shows depositpaid=True
-        3. Create another booking with depositpaid=False
-        4. Verify response shows depositpaid=False
+        1. Create booking with the given depositpaid value
+        2. Verify response shows the same depositpaid value
+        
+        Args:
+            deposit (bool): depositpaid value sent in the request
         """
-        logger.info("\n>>> Test: Deposit paid field validation")
+        logger.info(f"\n>>> Test: Deposit paid field validation (depositpaid={deposit})")
         
-        # Step 1-2: Test with deposit paid = True
-        payload_with_deposit = get_booking_payload_with_params(depositpaid=True)
-        response_with_deposit = self.api_client.post(Config.BOOKING_ENDPOINT, payload_with_deposit)
-        self.assertion_helper.assert_field_value(response_with_deposit, "booking.depositpaid", True)
+        # Step 1: Create booking
+        payload = get_booking_payload_with_params(depositpaid=deposit)
+        response = api_client.post(Config.BOOKING_ENDPOINT, payload)
         
-        # Step 3-4: Test with deposit paid = False
-        payload_without_deposit = get_booking_payload_with_params(depositpaid=False)
-        response_without_deposit = self.api_client.post(Config.BOOKING_ENDPOINT, payload_without_deposit)
-        self.assertion_helper.assert_field_value(response_without_deposit, "booking.depositpaid", False)
+        # Step 2: Verify depositpaid
+        assertion_helper.assert_field_value(response, "booking.depositpaid", deposit)
         
         logger.info("✓ Test passed: Deposit paid field validated correctly")
     
+    @pytest.mark.slow
     @pytest.mark.parametrize("test_data", TEST_DATA_SETS)
-    def test_create_multiple_bookings(self, test_data):
+    def test_create_multiple_bookings(self, test_data, api_client, assertion_helper):
         """
         Test Case 6: Parameterized test - Create multiple bookings with different data
         
@@ -178,26 +168,45 @@ class TestBookingAPI:
         )
         
         # Send request
-        response = self.api_client.post(Config.BOOKING_ENDPOINT, payload)
+        response = api_client.post(Config.BOOKING_ENDPOINT, payload)
         
         # Validate
-        self.assertion_helper.assert_status_code(response)
-        self.assertion_helper.assert_field_value(response, "booking.firstname", test_data["firstname"])
-        self.assertion_helper.assert_field_value(response, "booking.lastname", test_data["lastname"])
+        assertion_helper.assert_status_code(response)
+        assertion_helper.assert_field_value(response, "booking.firstname", test_data["firstname"])
+        assertion_helper.assert_field_value(response, "booking.lastname", test_data["lastname"])
         
         logger.info(f"✓ Booking created for {test_data['firstname']} {test_data['lastname']}")
+    
+    def test_create_multiple_bookings_batch(self, api_client, assertion_helper):
+        """
+        Test Case 6b: Create all TEST_DATA_SETS bookings concurrently and validate each response
+        """
+        logger.info("\n>>> Test: Create multiple bookings in one batch")
+        
+        payloads = [
+            get_booking_payload_with_params(
+                firstname=test_data["firstname"],
+                lastname=test_data["lastname"],
+                totalprice=test_data["totalprice"],
+                depositpaid=test_data["depositpaid"]
+            )
+            for test_data in TEST_DATA_SETS
+        ]
+        
+        responses = api_client.post_many(Config.BOOKING_ENDPOINT, payloads)
+        
+        for test_data, response in zip(TEST_DATA_SETS, responses):
+            assertion_helper.assert_status_code(response)
+            assertion_helper.assert_field_value(response, "booking.firstname", test_data["firstname"])
+            assertion_helper.assert_field_value(response, "booking.lastname", test_data["lastname"])
+        
+        logger.info(f"✓ Batch of {len(responses)} bookings created")
 
 
 class TestBookingAPIEdgeCases:
     """Test suite for edge cases and error handling"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup test fixtures"""
-        self.api_client = APIClient(Config.BASE_URL)
-        self.assertion_helper = AssertionHelper()
-    
-    def test_booking_with_special_characters(self):
+    def test_booking_with_special_characters(self, api_client, assertion_helper):
         """
         Test Case 7: Create booking with special characters in name
         """
@@ -208,27 +217,27 @@ class TestBookingAPIEdgeCases:
             lastname="García-Smith"
         )
         
-        response = self.api_client.post(Config.BOOKING_ENDPOINT, payload)
-        self.assertion_helper.assert_status_code(response)
-        self.assertion_helper.assert_field_value(response, "booking.firstname", "José")
+        response = api_client.post(Config.BOOKING_ENDPOINT, payload)
+        assertion_helper.assert_status_code(response)
+        assertion_helper.assert_field_value(response, "booking.firstname", "José")
         
         logger.info("✓ Test passed: Special characters handled correctly")
     
-    def test_booking_with_zero_price(self):
+    def test_booking_with_zero_price(self, api_client, assertion_helper):
         """
         Test Case 8: Create booking with zero price
         """
         logger.info("\n>>> Test: Booking with zero price")
         
         payload = get_booking_payload_with_params(totalprice=0)
-        response = self.api_client.post(Config.BOOKING_ENDPOINT, payload)
+        response = api_client.post(Config.BOOKING_ENDPOINT, payload)
         
-        self.assertion_helper.assert_status_code(response)
-        self.assertion_helper.assert_field_value(response, "booking.totalprice", 0)
+        assertion_helper.assert_status_code(response)
+        assertion_helper.assert_field_value(response, "booking.totalprice", 0)
         
         logger.info("✓ Test passed: Zero price booking created successfully")
     
-    def test_booking_with_high_price(self):
+    def test_booking_with_high_price(self, api_client, assertion_helper):
         """
         Test Case 9: Create booking with high price value
         """
@@ -236,9 +245,9 @@ class TestBookingAPIEdgeCases:
         
         high_price = 999999
         payload = get_booking_payload_with_params(totalprice=high_price)
-        response = self.api_client.post(Config.BOOKING_ENDPOINT, payload)
+        response = api_client.post(Config.BOOKING_ENDPOINT, payload)
         
-        self.assertion_helper.assert_status_code(response)
-        self.assertion_helper.assert_field_value(response, "booking.totalprice", high_price)
+        assertion_helper.assert_status_code(response)
+        assertion_helper.assert_field_value(response, "booking.totalprice", high_price)
         
         logger.info(f"✓ Test passed: High price ({high_price}) booking created successfully")
@@ -4,17 +4,52 @@ API Client module - Contains reusable API client and assertion utilities
 import requests
 import json
 import logging
+import orjson
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config.config import Config
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union
+
+if TYPE_CHECKING:
+    import httpx
+
+# APIClient returns httpx responses when Config.USE_HTTPX is set
+Response = Union[requests.Response, "httpx.Response"]
 
-# Configure logging
-logging.basicConfig(
-    level=Config.LOG_LEVEL,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
+def configure_logging():
+    """Configure root logging for a test run; called by the runner, not at import"""
+    logging.basicConfig(
+        level=Config.LOG_LEVEL,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+
+def _json(response) -> Any:
+    """
+    Parse a response body with orjson, caching the result on the response
+    
+    Args:
+        response: API response object
+        
+    Returns:
+        Parsed JSON body
+    """
+    if not hasattr(response, "_cached_json"):
+        response._cached_json = orjson.loads(response.content)
+    return response._cached_json
+
+
+@lru_cache(maxsize=None)
+def _split_path(field_path: str) -> tuple:
+    """Split a dotted field path (e.g. "booking.firstname") into its keys, once per path"""
+    return tuple(field_path.split("."))
+
+
 class APIClient:
     """Reusable API Client for making HTTP requests"""
     
@@ -31,82 +66,247 @@ class APIClient:
             "Content-Type": Config.CONTENT_TYPE,
             "Accept": Config.CONTENT_TYPE
         }
+        
+        if Config.USE_HTTPX:
+            # Optional dependency: one multiplexed HTTP/2 connection per host.
+            # httpx only retries failed connection attempts, never 429/5xx responses.
+            import httpx
+            transport = httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_keepalive_connections=10)
+            )
+            self._client = httpx.Client(
+                transport=transport,
+                headers=self.headers,
+                timeout=self.timeout
+            )
+            self._request_errors = (httpx.HTTPError,)
+            self._body_kwarg = "content"
+        else:
+            # Pooled session keeps connections alive between requests.
+            # Only idempotent verbs are retried so a POST never creates a duplicate booking,
+            # and read timeouts are never retried so a per-call timeout stays a hard limit.
+            # Once retries run out the last response is returned rather than raised,
+            # and Retry-After is ignored so a 429 cannot stall the suite.
+            self._client = requests.Session()
+            self._client.headers.update(self.headers)
+            retries = Retry(
+                total=3,
+                read=0,
+                backoff_factor=0.25,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+                raise_on_status=False,
+                respect_retry_after_header=False
+            )
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+            self._client.mount("https://", adapter)
+            self._client.mount("http://", adapter)
+            self._request_errors = (requests.exceptions.RequestException,)
+            self._body_kwarg = "data"
+        
         logger.info(f"APIClient initialized with base URL: {self.base_url}")
     
-    def post(self, endpoint: str, payload: Dict[str, Any]) -> requests.Response:
+    def post(self, endpoint: str, payload: Dict[str, Any],
+             timeout: Optional[float] = None) -> Response:
         """
         Make a POST request to the API
         
         Args:
             endpoint (str): API endpoint
             payload (dict): Request payload
+            timeout (float): Per-call timeout override in seconds
             
         Returns:
-            requests.Response: API response object
+            requests.Response | httpx.Response: API response object
         """
         url = f"{self.base_url}{endpoint}"
         
         logger.info(f"Making POST request to: {url}")
-        logger.debug(f"Request payload: {json.dumps(payload, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request payload: %s", json.dumps(payload, indent=2))
         
         try:
-            response = requests.post(
+            response = self._client.post(
                 url,
-                json=payload,
-                headers=self.headers,
-                timeout=self.timeout
+                **{self._body_kwarg: orjson.dumps(payload)},
+                timeout=self.timeout if timeout is None else timeout
             )
             
             logger.info(f"Response status code: {response.status_code}")
-            logger.debug(f"Response body: {response.text}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response body: %s", response.text)
             
             return response
             
-        except requests.exceptions.RequestException as e:
+        except self._request_errors as e:
             logger.error(f"Request failed: {str(e)}")
             raise
     
-    def get(self, endpoint: str) -> requests.Response:
+    def post_many(self, endpoint: str, payloads: List[Dict[str, Any]],
+                  max_workers: int = 8) -> List[Response]:
+        """
+        Make concurrent POST requests over the pooled session
+        
+        Args:
+            endpoint (str): API endpoint
+            payloads (list): Request payloads, one per request
+            max_workers (int): Maximum number of requests in flight
+            
+        Returns:
+            list: API response objects, in the same order as payloads
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda payload: self.post(endpoint, payload), payloads))
+    
+    def get(self, endpoint: str, timeout: Optional[float] = None) -> Response:
         """
         Make a GET request to the API
         
         Args:
             endpoint (str): API endpoint
+            timeout (float): Per-call timeout override in seconds
             
         Returns:
-            requests.Response: API response object
+            requests.Response | httpx.Response: API response object
         """
         url = f"{self.base_url}{endpoint}"
         
         logger.info(f"Making GET request to: {url}")
         
         try:
-            response = requests.get(
+            response = self._client.get(
                 url,
-                headers=self.headers,
-                timeout=self.timeout
+                timeout=self.timeout if timeout is None else timeout
+            )
+            
+            logger.info(f"Response status code: {response.status_code}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response body: %s", response.text)
+            
+            return response
+            
+        except self._request_errors as e:
+            logger.error(f"Request failed: {str(e)}")
+            raise
+    
+    def put(self, endpoint: str, payload: Dict[str, Any],
+            headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = None) -> Response:
+        """
+        Make a PUT request to the API
+        
+        Args:
+            endpoint (str): API endpoint
+            payload (dict): Request payload
+            headers (dict): Extra headers merged over the session defaults
+            timeout (float): Per-call timeout override in seconds
+            
+        Returns:
+            requests.Response | httpx.Response: API response object
+        """
+        url = f"{self.base_url}{endpoint}"
+        
+        logger.info(f"Making PUT request to: {url}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request payload: %s", json.dumps(payload, indent=2))
+        
+        try:
+            response = self._client.put(
+                url,
+                **{self._body_kwarg: orjson.dumps(payload)},
+                headers=headers,
+                timeout=self.timeout if timeout is None else timeout
             )
             
             logger.info(f"Response status code: {response.status_code}")
-            logger.debug(f"Response body: {response.text}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response body: %s", response.text)
             
             return response
             
-        except requests.exceptions.RequestException as e:
+        except self._request_errors as e:
             logger.error(f"Request failed: {str(e)}")
             raise
+    
+    def delete(self, endpoint: str, headers: Optional[Dict[str, str]] = None,
+               timeout: Optional[float] = None) -> Response:
+        """
+        Make a DELETE request to the API
+        
+        Args:
+            endpoint (str): API endpoint
+            headers (dict): Extra headers merged over the session defaults
+            timeout (float): Per-call timeout override in seconds
+            
+        Returns:
+            requests.Response | httpx.Response: API response object
+        """
+        url = f"{self.base_url}{endpoint}"
+        
+        logger.info(f"Making DELETE request to: {url}")
+        
+        try:
+            response = self._client.delete(
+                url,
+                headers=headers,
+                timeout=self.timeout if timeout is None else timeout
+            )
+            
+            logger.info(f"Response status code: {response.status_code}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response body: %s", response.text)
+            
+            return response
+            
+        except self._request_errors as e:
+            logger.error(f"Request failed: {str(e)}")
+            raise
+    
+    def close(self):
+        """Close the underlying session/client and release pooled connections"""
+        self._client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
 class AssertionHelper:
     """Helper class for API response assertions"""
     
+    REQUIRED_TOP_LEVEL_KEYS = frozenset({"bookingid", "booking"})
+    REQUIRED_BOOKING_KEYS = frozenset({"firstname", "lastname", "totalprice", "depositpaid", "bookingdates"})
+    REQUIRED_DATES_KEYS = frozenset({"checkin", "checkout"})
+    
     @staticmethod
-    def assert_status_code(response: requests.Response, expected_codes: List[int] = None):
+    def _parse_body(response: Union[Response, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the parsed JSON body, passing already-parsed dicts through
+        
+        Args:
+            response (requests.Response | httpx.Response | dict): API response or its parsed JSON body
+            
+        Returns:
+            dict: Parsed response body
+        """
+        if isinstance(response, dict):
+            return response
+        try:
+            return _json(response)
+        except json.JSONDecodeError:
+            raise AssertionError(f"Response is not valid JSON: {response.text}")
+    
+    @staticmethod
+    def assert_status_code(response: Response, expected_codes: List[int] = None):
         """
         Assert response status code
         
         Args:
-            response (requests.Response): API response
+            response (requests.Response | httpx.Response): API response
             expected_codes (list): List of acceptable status codes
         """
         if expected_codes is None:
@@ -115,74 +315,68 @@ class AssertionHelper:
         assert response.status_code in expected_codes, \
             f"Expected status code {expected_codes}, but got {response.status_code}"
         
-        logger.info(f"✓ Status code assertion passed: {response.status_code}")
+        logger.debug("✓ Status code assertion passed: %s", response.status_code)
     
     @staticmethod
-    def assert_response_contains_keys(response: requests.Response, required_keys: List[str]):
+    def assert_response_contains_keys(response: Union[Response, Dict[str, Any]],
+                                      required_keys: List[str]):
         """
         Assert that response JSON contains required keys
         
         Args:
-            response (requests.Response): API response
+            response (requests.Response | httpx.Response | dict): API response or its parsed JSON body
             required_keys (list): List of required keys in response
         """
-        try:
-            response_json = response.json()
-        except json.JSONDecodeError:
-            raise AssertionError(f"Response is not valid JSON: {response.text}")
+        response_json = AssertionHelper._parse_body(response)
         
         for key in required_keys:
             assert key in response_json, \
                 f"Expected key '{key}' not found in response. Available keys: {response_json.keys()}"
             
-            logger.info(f"✓ Key '{key}' found in response with value: {response_json[key]}")
+            logger.debug("✓ Key '%s' found in response with value: %s", key, response_json[key])
     
     @staticmethod
-    def assert_booking_response_structure(response: requests.Response):
+    def assert_booking_response_structure(response: Union[Response, Dict[str, Any]]):
         """
         Assert that response contains expected booking structure
         
         Args:
-            response (requests.Response): API response
+            response (requests.Response | httpx.Response | dict): API response or its parsed JSON body
         """
-        required_top_level_keys = ["bookingid", "booking"]
-        required_booking_keys = ["firstname", "lastname", "totalprice", "depositpaid", "bookingdates"]
-        required_dates_keys = ["checkin", "checkout"]
+        response_json = AssertionHelper._parse_body(response)
         
         # Check top-level keys
-        AssertionHelper.assert_response_contains_keys(response, required_top_level_keys)
+        missing = AssertionHelper.REQUIRED_TOP_LEVEL_KEYS - response_json.keys()
+        assert not missing, \
+            f"Expected keys {sorted(missing)} not found in response. Available keys: {response_json.keys()}"
         
         # Check booking object keys
-        response_json = response.json()
-        booking = response_json.get("booking", {})
-        
-        for key in required_booking_keys:
-            assert key in booking, \
-                f"Expected key '{key}' not found in booking object. Available keys: {booking.keys()}"
-            logger.info(f"✓ Booking key '{key}' present with value: {booking[key]}")
+        booking = response_json["booking"]
+        missing = AssertionHelper.REQUIRED_BOOKING_KEYS - booking.keys()
+        assert not missing, \
+            f"Expected keys {sorted(missing)} not found in booking object. Available keys: {booking.keys()}"
         
         # Check bookingdates structure
-        booking_dates = booking.get("bookingdates", {})
-        for key in required_dates_keys:
-            assert key in booking_dates, \
-                f"Expected date key '{key}' not found in bookingdates. Available keys: {booking_dates.keys()}"
-            logger.info(f"✓ Booking date '{key}' present: {booking_dates[key]}")
+        booking_dates = booking["bookingdates"]
+        missing = AssertionHelper.REQUIRED_DATES_KEYS - booking_dates.keys()
+        assert not missing, \
+            f"Expected date keys {sorted(missing)} not found in bookingdates. Available keys: {booking_dates.keys()}"
+        
+        logger.debug("✓ Booking response structure valid for bookingid: %s", response_json["bookingid"])
     
     @staticmethod
-    def assert_field_value(response: requests.Response, field_path: str, expected_value: Any):
+    def assert_field_value(response: Union[Response, Dict[str, Any]], field_path: str,
+                           expected_value: Any):
         """
         Assert that a specific field in response has expected value
         
         Args:
-            response (requests.Response): API response
+            response (requests.Response | httpx.Response | dict): API response or its parsed JSON body
             field_path (str): Path to field (e.g., "booking.firstname")
             expected_value: Expected value
         """
-        response_json = response.json()
-        keys = field_path.split(".")
-        
-        current_value = response_json
-        for key in keys:
+        current_value = AssertionHelper._parse_body(response)
+        for key in _split_path(field_path):
             assert key in current_value, \
                 f"Key '{key}' not found in path '{field_path}'"
             current_value = current_value[key]
@@ -190,4 +384,4 @@ class AssertionHelper:
         assert current_value == expected_value, \
             f"Expected {field_path}={expected_value}, but got {current_value}"
         
-        logger.info(f"✓ Field assertion passed: {field_path}={expected_value}")
+        logger.debug("✓ Field assertion passed: %s=%s", field_path, expected_value)